@@ -1,74 +1,261 @@
+import functools
+import hashlib
 import re
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+import lxml.html
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup (the "fast" extra); fall back to the stdlib encoder
+    orjson = None
+
 BASE_URL = "https://4x.ant.design"
 OVERVIEW_PATH = "/components/overview-cn/"
 # Use project root cache directory if available to reuse previously cached HTML.
 CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
+# Cache files are named by URL hash; index.json maps each hash back to its URL.
+_CACHE_INDEX_FILE = CACHE_DIR / 'index.json'
+_CACHE_INDEX_LOCK = threading.Lock()
 HEADERS = {"User-Agent": "Mozilla/5.0 (MCP Antd Fetcher)"}
 EXPORT_DIR = Path(__file__).parent / "exports"
 EXPORT_DIR.mkdir(exist_ok=True)
+EXPORT_WORKERS = 8
+# Upper bound on requests per second sent to the docs site (cache hits are free).
+FETCH_RATE = 4.0
+# Bump when parse_component output changes so stale .json sidecars are ignored.
+_PARSED_CACHE_VERSION = 4
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False),
+))
+_LEADING_ALNUM_RE = re.compile(r'([A-Za-z0-9]+)')
+
+# Table classification keywords, one alternation per category.
+_RE_EVENTS = re.compile('事件|回调|listener|on')
+_RE_METHODS = re.compile('方法|method|函数')
+_RE_PROPS = re.compile('参数|属性|属性名|名称|配置项|参数名|字段|Prop|Property|选项|可配置项')
+_RE_PROPS_API = re.compile('类型|默认|必填|必选|可选值|参数')
+# Tokens marking a props row as required / optional; the first alternation wins.
+_RE_REQUIRED_TRUE = re.compile('是|必填|必选|true|必须')
+_RE_REQUIRED_FALSE = re.compile('否|可选|false|选填')
+
+# The docs site is served as UTF-8; pinning it lets lxml decode cached bytes directly.
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+# Table header -> normalised props_flat key. Keys are interned to match the interned
+# table headers, so lookups usually succeed on the identity check.
+_HEADER_SYNONYMS = {sys.intern(k): sys.intern(v) for k, v in {
+    '参数': 'name', '属性': 'name', '属性名': 'name', '名称': 'name', '配置项': 'name', '参数名': 'name', '字段': 'name', 'Prop': 'name', 'Property': 'name', '可配置项': 'name',
+    '说明': 'description', '描述': 'description', '备注': 'description', '含义': 'description',
+    '类型': 'type', 'Type': 'type', '数据类型': 'type',
+    '默认值': 'default', '默认': 'default', '缺省值': 'default',
+    '版本': 'version', 'Since': 'version',
+    '可选值': 'options', '选项': 'options', '可选': 'options', '枚举': 'options',
+    '是否必填': 'required', '必填': 'required', '必选': 'required', '是否必选': 'required'
+}.items()}
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Selectors are compiled once at import; plain descendant-by-tag lookups inside hot
+# loops use Element.iter() instead, which skips XPath evaluation entirely.
+# Overview cards are normally wrapped in their link (several cards may share one); the
+# nearest enclosing anchor is resolved by XPath instead of walking up from each card.
+_XP_CARDS = etree.XPath(f'//*[{_has_class("components-overview-card")}]')
+_XP_CARD_PARENT_LINK = etree.XPath('ancestor::a[1]')
+_XP_CARD_TITLE = etree.XPath(f'.//*[{_has_class("components-overview-title")}]')
+_XP_CARD_LINK = etree.XPath('.//a[@href]')
+_XP_MENU_LINKS = etree.XPath(f'//ul[{_has_class("ant-menu")}]//li//a[contains(@href, "/components/")]')
+_XP_TABLE_THS = etree.XPath('.//thead//tr//th')
+_XP_TBODY_TRS = etree.XPath('.//tbody//tr')
+
+# bs4's get_text() leaves out the contents of these elements; lxml's itertext() does not.
+_NON_TEXT_TAGS = ('script', 'style', 'template')
+
+def _parse_html(html: str | bytes):
+    """Parse a page, emptying script/style/template elements.
+
+    Clearing them once per document keeps _text() a plain itertext() join while matching
+    bs4's get_text() output. The emptied elements stay in place with their tail text, so
+    the surrounding text nodes are not merged (which would change ``sep``-joined text).
+    """
+    doc = lxml.html.document_fromstring(html, parser=_HTML_PARSER)
+    for el in list(doc.iter(*_NON_TEXT_TAGS)):
+        el.clear(keep_tail=True)
+    return doc
+
+def _text(el, sep: str = '', strip: bool = True) -> str:
+    """Concatenate the text nodes under ``el`` (mirrors bs4 ``get_text``).
+
+    Comments are skipped by itertext(); script/style/template are removed by _parse_html().
+    """
+    if not len(el):
+        # Leaf element (most table cells and headers): its only text node is el.text.
+        text = el.text or ''
+        return text.strip() if strip else text
+    if strip:
+        return sep.join(t for t in (t.strip() for t in el.itertext()) if t)
+    return sep.join(el.itertext())
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact or (``pretty``) indented, preferring orjson.
+
+    The stdlib fallback uses the same separators, so output does not depend on whether
+    orjson is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=(orjson.OPT_INDENT_2 if pretty else 0) | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles those
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class FetchError(Exception):
     pass
 
-def fetch_url(url: str, *, force: bool = False, sleep: float = 0.5) -> str:
-    cache_file = CACHE_DIR / (re.sub(r'[^a-zA-Z0-9]+', '_', url) + '.html')
-    if cache_file.exists() and not force:
-        return cache_file.read_text(encoding='utf-8', errors='ignore')
-    resp = requests.get(url, headers=HEADERS, timeout=15)
+class _RateLimiter:
+    """Token bucket shared by all fetch threads; only real network requests take a token."""
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            # Going negative reserves a future token; the caller sleeps off the debt outside the lock.
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+_LIMITER = _RateLimiter(FETCH_RATE, burst=int(FETCH_RATE))
+
+def _cache_key(url: str) -> str:
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+def _cache_path(url: str, suffix: str) -> Path:
+    return CACHE_DIR / (_cache_key(url) + suffix)
+
+def _record_cache_key(url: str) -> None:
+    """Keep CACHE_DIR/index.json (hash -> url) so hashed cache files stay identifiable."""
+    key = _cache_key(url)
+    with _CACHE_INDEX_LOCK:
+        try:
+            index = json.loads(_CACHE_INDEX_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            index = {}
+        if index.get(key) != url:
+            index[key] = url
+            _CACHE_INDEX_FILE.write_text(json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+def _conditional_headers(meta_file: Path) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since from the validators saved with a cached page."""
+    try:
+        meta = json.loads(meta_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+def fetch_url(url: str, *, force: bool = False) -> bytes:
+    """Return the raw page bytes; decoding is left to lxml so no intermediate str is built.
+
+    With ``force`` a cached page is revalidated with a conditional GET rather than
+    downloaded again; a 304 reply keeps the cached bytes (and their mtime) as they are.
+    """
+    cache_file = _cache_path(url, '.html')
+    meta_file = _cache_path(url, '.meta.json')
+    cached = cache_file.exists()
+    if cached and not force:
+        return cache_file.read_bytes()
+    headers = _conditional_headers(meta_file) if cached else {}
+    _LIMITER.acquire()
+    resp = _SESSION.get(url, timeout=15, headers=headers)
+    if resp.status_code == 304 and cached:
+        return cache_file.read_bytes()
     if resp.status_code != 200:
         raise FetchError(f"Failed {url} status={resp.status_code}")
-    text = resp.text
-    cache_file.write_text(text, encoding='utf-8')
-    time.sleep(sleep)
-    return text
+    content = resp.content
+    cache_file.write_bytes(content)
+    meta = {'etag': resp.headers.get('ETag'), 'last_modified': resp.headers.get('Last-Modified')}
+    if any(meta.values()):
+        meta_file.write_text(json.dumps(meta), encoding='utf-8')
+    else:
+        meta_file.unlink(missing_ok=True)
+    _record_cache_key(url)
+    return content
 
-def parse_overview(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, 'lxml')
-    components: List[Dict[str, Any]] = []
+def parse_overview(html: str | bytes) -> List[Dict[str, Any]]:
+    doc = _parse_html(html)
+    # (dedup key, component) pairs; the casefolded key is computed once per candidate.
+    components: List[Tuple[str, Dict[str, Any]]] = []
 
     def normalize_name(raw: str) -> str:
         raw = raw.strip()
-        m = re.match(r'([A-Za-z0-9]+)', raw)
+        m = _LEADING_ALNUM_RE.match(raw)
         if m:
             return m.group(1)
         return raw.split()[0] if raw else raw
 
-    for card in soup.select('.components-overview-card'):
-        title_el = card.select_one('.components-overview-title')
-        if not title_el:
+    for card in _XP_CARDS(doc):
+        title_els = _XP_CARD_TITLE(card)
+        if not title_els:
             continue
-        full_title = title_el.get_text(strip=True)
+        full_title = _text(title_els[0])
         name = normalize_name(full_title)
-        link_el = card.find_parent('a') or card.select_one('a[href]')
-        href = link_el['href'] if link_el and link_el.has_attr('href') else None
+        link_els = _XP_CARD_PARENT_LINK(card) or _XP_CARD_LINK(card)
+        href = link_els[0].get('href') if link_els else None
         desc = ''
         url = BASE_URL + href if href and href.startswith('/') else href
-        components.append({
+        components.append((name.casefold(), {
             'name': name,
             'display_name': full_title,
             'url': url,
             'description': desc,
-        })
+        }))
 
-    for li in soup.select('ul.ant-menu li a[href*="/components/"]'):
-        spans_text = ''.join(span.get_text(strip=True) for span in li.select('span')) or li.get_text(strip=True)
+    for li in _XP_MENU_LINKS(doc):
+        spans_text = ''.join(_text(span) for span in li.iter('span')) or _text(li)
         eng_name = normalize_name(spans_text)
         href = li.get('href')
         url = BASE_URL + href if href and href.startswith('/') else href
-        components.append({
+        components.append((eng_name.casefold(), {
             'name': eng_name,
             'display_name': spans_text,
             'url': url,
             'description': ''
-        })
+        }))
 
     def is_valid(c: Dict[str, Any]) -> bool:
         u = c.get('url')
@@ -79,26 +266,20 @@ def parse_overview(html: str) -> List[Dict[str, Any]]:
         return True
 
     cleaned: Dict[str, Dict[str, Any]] = {}
-    for c in components:
+    for key, c in components:
         if not is_valid(c):
             continue
-        key = c['name'].lower()
         if key not in cleaned or len(c.get('display_name','')) > len(cleaned[key].get('display_name','')):
             cleaned[key] = c
     return list(cleaned.values())
 
-def parse_component(html: str) -> Dict[str, Any]:
-    soup = BeautifulSoup(html, 'lxml')
+def parse_component(html: str | bytes) -> Dict[str, Any]:
+    doc = _parse_html(html)
     data: Dict[str, Any] = {}
-    h1 = soup.select_one('h1')
-    if h1:
-        data['title'] = h1.get_text(strip=True)
+    title: str | None = None
     intro_parts = []
-    for p in soup.select('p')[:5]:
-        text = p.get_text(strip=True)
-        if text:
-            intro_parts.append(text)
-    data['intro'] = intro_parts
+    p_seen = 0
+    examples = []
 
     props_tables: List[Dict[str, Any]] = []
     event_tables: List[Dict[str, Any]] = []
@@ -107,27 +288,46 @@ def parse_component(html: str) -> Dict[str, Any]:
 
     def classify(header: List[str]) -> str:
         h_join = ' '.join(header)
-        if any(k in h_join for k in ["事件", "回调", "listener", "on" ]):
+        if _RE_EVENTS.search(h_join):
             return 'events'
-        if any(k in h_join for k in ["方法", "method", "函数"]):
+        if _RE_METHODS.search(h_join):
             return 'methods'
-        prop_keywords = ["参数", "属性", "属性名", "名称", "配置项", "参数名", "字段", "Prop", "Property", "选项", "可配置项"]
-        if any(pk in h_join for pk in prop_keywords):
-            return 'props'
-        if any(k in h_join for k in ["类型", "默认", "必填", "必选", "可选值"]) and 'API' in h_join:
+        if _RE_PROPS.search(h_join):
             return 'props'
-        if 'API' in h_join and any(k in h_join for k in ["类型", "默认", "参数"]):
+        if 'API' in h_join and _RE_PROPS_API.search(h_join):
             return 'props'
         return 'other'
 
-    for tbl in soup.select('table'):
-        header = [th.get_text(strip=True) for th in tbl.select('thead tr th')]
+    # One document-order walk collects the title, intro paragraphs, tables and code samples.
+    for el in doc.iter('h1', 'p', 'table', 'code'):
+        tag = el.tag
+        if tag == 'p':
+            if p_seen < 5:
+                p_seen += 1
+                text = _text(el)
+                if text:
+                    intro_parts.append(text)
+            continue
+        if tag == 'code':
+            if next(el.iterancestors('pre'), None) is not None:
+                content = _text(el, '\n', strip=False)
+                if content:
+                    examples.append(content)
+            continue
+        if tag == 'h1':
+            if title is None:
+                title = _text(el)
+            continue
+        # Interned once per table so every row dict shares the same key objects.
+        header = [sys.intern(_text(th)) for th in _XP_TABLE_THS(el)]
+        h_tuple = tuple(header)
+        n_header = len(h_tuple)
         rows_struct = []
-        for tr in tbl.select('tbody tr'):
-            cells = [td.get_text('\n', strip=True) for td in tr.select('td')]
+        for tr in _XP_TBODY_TRS(el):
+            cells = [_text(td, '\n') for td in tr.iter('td')]
             if cells:
-                if header and len(header) == len(cells):
-                    row_dict = {header[i]: cells[i] for i in range(len(header))}
+                if n_header and n_header == len(cells):
+                    row_dict = dict(zip(h_tuple, cells))
                 else:
                     row_dict = {'cells': cells}
                 rows_struct.append(row_dict)
@@ -142,6 +342,9 @@ def parse_component(html: str) -> Dict[str, Any]:
         else:
             other_tables.append(table_obj)
 
+    if title is not None:
+        data['title'] = title
+    data['intro'] = intro_parts
     data['props'] = props_tables
     data['events'] = event_tables
     data['methods'] = method_tables
@@ -153,81 +356,106 @@ def parse_component(html: str) -> Dict[str, Any]:
         'other': len(other_tables)
     }
 
-    examples = []
-    for code in soup.select('pre code'):
-        content = code.get_text('\n', strip=False)
-        if content:
-            examples.append(content)
     data['examples'] = examples
 
-    header_synonyms = {
-        '参数': 'name', '属性': 'name', '属性名': 'name', '名称': 'name', '配置项': 'name', '参数名': 'name', '字段': 'name', 'Prop': 'name', 'Property': 'name', '可配置项': 'name',
-        '说明': 'description', '描述': 'description', '备注': 'description', '含义': 'description',
-        '类型': 'type', 'Type': 'type', '数据类型': 'type',
-        '默认值': 'default', '默认': 'default', '缺省值': 'default',
-        '版本': 'version', 'Since': 'version',
-        '可选值': 'options', '选项': 'options', '可选': 'options', '枚举': 'options',
-        '是否必填': 'required', '必填': 'required', '必选': 'required', '是否必选': 'required'
-    }
+    data['props_flat'] = flatten_props(props_tables)
+    return data
 
-    props_flat: List[Dict[str, Any]] = []
-
-    def normalize_row(row: Dict[str, Any], header: List[str]) -> Dict[str, Any]:
-        normalized: Dict[str, Any] = {'raw': row}
-        if 'cells' in row:
-            for i, h in enumerate(header):
-                key = header_synonyms.get(h, h)
-                cells = row['cells']
-                if i < len(cells):
-                    normalized[key] = cells[i]
-        else:
-            for k, v in row.items():
-                key = header_synonyms.get(k, k)
-                normalized[key] = v
-        name = normalized.get('name')
-        if name:
-            normalized['name'] = name.split('\n')[0].strip()
-        req_val = normalized.get('required')
-        if isinstance(req_val, str):
-            if any(token in req_val for token in ['是', '必填', '必选', 'true', '必须']):
-                normalized['required'] = True
-            elif any(token in req_val for token in ['否', '可选', 'false', '选填']):
-                normalized['required'] = False
-        return normalized
+def _normalize_row(row: Dict[str, Any], renamed: Tuple[str, ...]) -> Dict[str, Any]:
+    normalized: Dict[str, Any] = {'raw': row}
+    if 'cells' in row:
+        normalized.update(zip(renamed, row['cells']))
+    elif len(row) == len(renamed):
+        normalized.update(zip(renamed, row.values()))
+    else:
+        # Duplicate header names collapsed this row's keys; map them one by one.
+        for k, v in row.items():
+            normalized[_HEADER_SYNONYMS.get(k, k)] = v
+    name = normalized.get('name')
+    if name:
+        normalized['name'] = name.split('\n')[0].strip()
+    req_val = normalized.get('required')
+    if isinstance(req_val, str):
+        if _RE_REQUIRED_TRUE.search(req_val):
+            normalized['required'] = True
+        elif _RE_REQUIRED_FALSE.search(req_val):
+            normalized['required'] = False
+    return normalized
 
+def flatten_props(props_tables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize every row of the props tables into one list keyed by canonical names."""
+    props_flat: List[Dict[str, Any]] = []
     for tbl in props_tables:
-        header = tbl['header']
+        # Header synonyms are resolved once per table instead of once per cell.
+        renamed = tuple(_HEADER_SYNONYMS.get(h, h) for h in tbl['header'])
         for row in tbl['rows']:
-            props_flat.append(normalize_row(row, header))
+            props_flat.append(_normalize_row(row, renamed))
+    return props_flat
 
-    data['props_flat'] = props_flat
-    return data
+def overview_cache_file() -> Path:
+    """Where the overview page is cached (the file may not exist yet)."""
+    return _cache_path(BASE_URL + OVERVIEW_PATH, '.html')
 
 def build_component_index(force: bool = False) -> List[Dict[str, Any]]:
     html = fetch_url(BASE_URL + OVERVIEW_PATH, force=force)
     return parse_overview(html)
 
+# Parsed pages kept in memory.
+PARSED_CACHE_SIZE = 128
+
+@functools.lru_cache(maxsize=PARSED_CACHE_SIZE)
+def _load_component(url: str, html_mtime: int) -> Dict[str, Any]:
+    """Return the parsed page, reusing the on-disk .json sidecar when it is newer than the HTML."""
+    json_file = _cache_path(url, '.json')
+    try:
+        if json_file.stat().st_mtime_ns >= html_mtime:
+            cached = json.loads(json_file.read_text(encoding='utf-8'))
+            if cached.get('version') == _PARSED_CACHE_VERSION:
+                return cached['data']
+    except (OSError, ValueError):
+        pass
+    data = parse_component(fetch_url(url))
+    json_file.write_text(json.dumps({'version': _PARSED_CACHE_VERSION, 'data': data}, ensure_ascii=False), encoding='utf-8')
+    return data
+
 def get_component_detail(url: str, force: bool = False) -> Dict[str, Any]:
-    html = fetch_url(url, force=force)
-    data = parse_component(html)
+    html_file = _cache_path(url, '.html')
+    if force or not html_file.exists():
+        fetch_url(url, force=force)
+    # Shallow copy: callers annotate the result (source_url, name) and the parsed dict is shared.
+    data = dict(_load_component(url, html_file.stat().st_mtime_ns))
     data['source_url'] = url
     return data
 
-def export_all_components(*, force: bool = False, filepath: str | None = None, validate: bool = True) -> Dict[str, Any]:
+def export_all_components(*, force: bool = False, filepath: str | None = None, validate: bool = True, max_workers: int = EXPORT_WORKERS) -> Dict[str, Any]:
     index = build_component_index(force=force)
-    all_details = []
-    for comp in index:
-        try:
-            if not comp.get('url'):
-                raise FetchError('Missing URL')
-            detail = get_component_detail(comp['url'], force=force)
-            detail['name'] = comp['name']
-            all_details.append(detail)
-        except Exception as e:
-            all_details.append({'name': comp.get('name'), 'error': str(e)})
-    if validate:
-        all_details = [d for d in all_details if 'error' not in d]
     export_path = filepath or str(EXPORT_DIR / 'antd_components_all.json')
-    with open(export_path, 'w', encoding='utf-8') as f:
-        json.dump({'generated_at': time.time(), 'count': len(all_details), 'components': all_details}, f, ensure_ascii=False, indent=2)
-    return {'filepath': export_path, 'count': len(all_details), 'errors': sum(1 for d in all_details if 'error' in d)}
+    count = 0
+    errors = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as ex, open(export_path, 'wb') as f:
+        pending = deque(
+            (comp, ex.submit(get_component_detail, comp['url'], force=force) if comp.get('url') else None)
+            for comp in index
+        )
+        # Components are written one by one, in overview order, as soon as each is ready,
+        # so the full export never has to be held in memory.
+        f.write(b'{"generated_at":' + dumps(time.time()) + b',"components":[')
+        while pending:
+            comp, fut = pending.popleft()
+            try:
+                if fut is None:
+                    raise FetchError('Missing URL')
+                detail = fut.result()
+                detail['name'] = comp['name']
+            except Exception as e:
+                detail = {'name': comp.get('name'), 'error': str(e)}
+            if 'error' in detail:
+                if validate:
+                    continue
+                errors += 1
+            if count:
+                f.write(b',')
+            f.write(dumps(detail))
+            count += 1
+        f.write(b'],"count":%d}' % count)
+    return {'filepath': export_path, 'count': count, 'errors': errors}
@@ -1,199 +1,12 @@
+import bisect
+from array import array
 import json
+import os
+import select
 import sys
-from typing import Any, Dict
-
-import fetcher
-
-TOOLS = {
-    'list_components': {
-        'description': 'List AntD components from overview page',
-        'input_schema': {'type': 'object', 'properties': {'force': {'type': 'boolean'}}, 'required': []}
-    },
-    'get_component': {
-        'description': 'Get detailed info for a component by name',
-        'input_schema': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'force': {'type': 'boolean'}}, 'required': ['name']}
-    },
-    'search_components': {
-        'description': 'Search components by substring in name or description',
-        'input_schema': {'type': 'object', 'properties': {'query': {'type': 'string'}}, 'required': ['query']}
-    },
-    'export_all': {
-        'description': 'Fetch all component pages and persist structured JSON locally',
-        'input_schema': {'type': 'object', 'properties': {'force': {'type': 'boolean'}, 'filepath': {'type': 'string'}}, 'required': []}
-    },
-    'get_component_props': {
-        'description': 'Return flattened props list (props_flat) for a given component',
-        'input_schema': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'force': {'type': 'boolean'}}, 'required': ['name']}
-    }
-}
-
-_index_cache = None
-_details_cache: Dict[str, Dict[str, Any]] = {}
-
-PRETTY = False
-COLOR = False
-
-
-def ensure_index(force: bool = False):
-    global _index_cache
-    if _index_cache is None or force:
-        _index_cache = fetcher.build_component_index(force=force)
-    return _index_cache
-
-
-def handle_list_components(params: Dict[str, Any]):
-    force = params.get('force', False)
-    index = ensure_index(force=force)
-    return index
-
-
-def handle_get_component(params: Dict[str, Any]):
-    name = params.get('name')
-    if not name:
-        return {'error': 'Component name not provided in arguments'}
-    force = params.get('force', False)
-    index = ensure_index(force=force)
-    target = next((c for c in index if c['name'].lower() == name.lower()), None)
-    if not target:
-        return {'error': f'Component {name} not found'}
-    url = target['url']
-    if url not in _details_cache or force:
-        _details_cache[url] = fetcher.get_component_detail(url, force=force)
-    return _details_cache[url]
-
-
-def handle_search_components(params: Dict[str, Any]):
-    query = params['query'].lower()
-    index = ensure_index()
-    results = [c for c in index if query in c['name'].lower() or query in c.get('description', '').lower()]
-    return results
-
-
-def handle_export_all(params: Dict[str, Any]):
-    force = params.get('force', False)
-    filepath = params.get('filepath')
-    summary = fetcher.export_all_components(force=force, filepath=filepath)
-    return summary
-
-
-def handle_get_component_props(params: Dict[str, Any]):
-    name = params.get('name')
-    if not name:
-        return {'error': 'Component name not provided in arguments'}
-    force = params.get('force', False)
-    index = ensure_index(force=force)
-    target = next((c for c in index if c['name'].lower() == name.lower()), None)
-    if not target:
-        return {'error': f'Component {name} not found'}
-    url = target['url']
-    if url not in _details_cache or force:
-        _details_cache[url] = fetcher.get_component_detail(url, force=force)
-    detail = _details_cache[url]
-    return {'component': name, 'props_flat': detail.get('props_flat', []), 'count': len(detail.get('props_flat', []))}
-
-
-def rpc_result(id_: Any, result: Any):
-    return {'jsonrpc': '2.0', 'id': id_, 'result': result}
-
-
-def rpc_error(id_: Any, code: int, message: str):
-    return {'jsonrpc': '2.0', 'id': id_, 'error': {'code': code, 'message': message}}
-
-
-def process_tool_call(tool_name: str, arguments: Dict[str, Any]):
-    if tool_name == 'list_components':
-        return handle_list_components(arguments)
-    if tool_name == 'get_component':
-        return handle_get_component(arguments)
-    if tool_name == 'search_components':
-        return handle_search_components(arguments)
-    if tool_name == 'export_all':
-        return handle_export_all(arguments)
-    if tool_name == 'get_component_props':
-        return handle_get_component_props(arguments)
-    return {'error': f'Tool {tool_name} not implemented'}
-
-
-def process_request(req: Dict[str, Any]):
-    method = req.get('method')
-    id_ = req.get('id')
-    if method == 'tools/list':
-        tools_meta = []
-        for name, meta in TOOLS.items():
-            tools_meta.append({'name': name, 'description': meta['description'], 'input_schema': meta['input_schema']})
-        return rpc_result(id_, {'tools': tools_meta})
-    if method == 'tools/call':
-        params = req.get('params', {})
-        tool_name = params.get('name')
-        arguments = params.get('arguments', {}) or {}
-        if tool_name not in TOOLS:
-            return rpc_error(id_, -32601, f'Unknown tool {tool_name}')
-        try:
-            result = process_tool_call(tool_name, arguments)
-            return rpc_result(id_, {'content': result})
-        except Exception as e:
-            return rpc_error(id_, -32603, f'Internal error: {e}')
-    return rpc_error(id_, -32601, f'Unknown method {method}')
-
-
-def emit(obj: Dict[str, Any]):
-    if PRETTY:
-        text = json.dumps(obj, ensure_ascii=False, indent=2)
-    else:
-        text = json.dumps(obj, ensure_ascii=False)
-    if COLOR:
-        if 'error' in obj:
-            text = '\x1b[31m' + text + '\x1b[0m'
-        else:
-            text = '\x1b[32m' + text + '\x1b[0m'
-    sys.stdout.write(text + '\n')
-    sys.stdout.flush()
-
-
-def main():
-    import argparse
-    import os
-    parser = argparse.ArgumentParser(description='AntD MCP Server')
-    parser.add_argument('--once', help='Provide a single JSON-RPC request string to process then exit')
-    parser.add_argument('--debug', action='store_true', help='Enable debug logging to stderr')
-    parser.add_argument('--pretty', action='store_true', help='Pretty-print JSON output')
-    parser.add_argument('--color', action='store_true', help='Colorize output (ANSI)')
-    args = parser.parse_args()
-    debug = args.debug or bool(os.environ.get('MCP_DEBUG'))
-    global PRETTY, COLOR
-    PRETTY = args.pretty or bool(os.environ.get('MCP_PRETTY'))
-    COLOR = args.color or bool(os.environ.get('MCP_COLOR'))
-
-    if args.once:
-        try:
-            if debug:
-                sys.stderr.write(f'[DEBUG] raw_once={args.once}\n')
-            req = json.loads(args.once)
-            out = process_request(req)
-            emit(out)
-        except Exception as e:
-            emit(rpc_error(None, -32700, f'Parse error: {e}'))
-        return
-
-    for line in sys.stdin:
-        if debug:
-            sys.stderr.write(f'[DEBUG] raw_line={repr(line)}\n')
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            req = json.loads(line)
-        except Exception as e:
-            emit(rpc_error(None, -32700, f'Parse error: {e}'))
-            continue
-        resp = process_request(req)
-        emit(resp)
-
-if __name__ == '__main__':
-    main()
-import json
-import sys
-from typing import Any, Dict
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
 
 # Allow running as script: python src/antd_mcp/server.py
 if __package__ is None or __package__ == "":
@@ -218,7 +31,7 @@ TOOLS = {
     },
     'export_all': {
         'description': 'Fetch all component pages and persist structured JSON locally',
-        'input_schema': {'type': 'object', 'properties': {'force': {'type': 'boolean'}, 'filepath': {'type': 'string'}}, 'required': []}
+        'input_schema': {'type': 'object', 'properties': {'force': {'type': 'boolean'}, 'filepath': {'type': 'string'}, 'max_workers': {'type': 'integer', 'minimum': 1}}, 'required': []}
     },
     'get_component_props': {
         'description': 'Return flattened props list (props_flat) for a given component',
@@ -226,53 +39,262 @@ TOOLS = {
     }
 }
 
-_index_cache = None
-_details_cache: Dict[str, Dict[str, Any]] = {}
+# tools/list is static, so its payload is built once and shared by every response.
+_TOOLS_LIST_RESULT = {
+    'tools': [{'name': name, 'description': meta['description'], 'input_schema': meta['input_schema']} for name, meta in TOOLS.items()]
+}
+
+_index_cache: List['Component'] | None = None
+# Parsed overview index persisted across processes, so a cold start skips parsing. It is
+# valid for as long as the cached overview HTML it was built from is not newer.
+_INDEX_CACHE_FILE = fetcher.CACHE_DIR / 'component_index.json'
+_index_by_name_lc: Dict[str, 'Component'] = {}
+# One buffer holding every entry's name + b'\x01' + description, records separated by
+# b'\x00'; _search_starts[i] is where entry i begins.
+_search_buf = b''
+_search_starts: List[int] = []
+# Suffix array over _search_buf (offsets sorted by the suffix starting there), so a query
+# is two bisects plus a walk over its hits. Only built for catalogs of at least
+# _SUFFIX_INDEX_MIN entries; smaller ones are scanned with bytes.find, which is cheaper
+# than building the index.
+_SUFFIX_INDEX_MIN = 256
+_suffix_index: array | None = None
+
+
+@dataclass(slots=True)
+class Component:
+    """One overview index entry, plus the normalized forms lookups and searches need."""
+    name: str
+    display_name: str
+    url: str
+    description: str
+    name_lc: str = field(init=False, repr=False)
+    # Casefolded UTF-8 name and description, so searches don't re-normalize per request.
+    name_b: bytes = field(init=False, repr=False)
+    desc_b: bytes = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.name_lc = self.name.lower()
+        self.name_b = self.name.casefold().encode('utf-8')
+        self.desc_b = self.description.casefold().encode('utf-8')
+
+    @classmethod
+    def from_dict(cls, c: Dict[str, Any]) -> 'Component':
+        name, url = c['name'], c['url']
+        if not isinstance(name, str) or not isinstance(url, str):
+            raise TypeError('component name and url must be strings')
+        return cls(name, c.get('display_name', name), url, c.get('description', ''))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The wire (and persisted index) form of the entry."""
+        return {'name': self.name, 'display_name': self.display_name, 'url': self.url,
+                'description': self.description}
+
+
+class _LRUCache(OrderedDict):
+    """Dict capped at ``maxsize`` entries that evicts the least recently used one."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class _DetailDict(dict):
+    """A cached component detail that memoizes its compact JSON encoding.
+
+    Still a plain dict to every consumer; the default output path splices json_bytes()
+    into the response envelope so a hit isn't re-serialized per request. Cached details
+    are shared, so they must not be mutated.
+    """
+
+    __slots__ = ('_json',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._json = None
+
+    def json_bytes(self) -> bytes:
+        if self._json is None:
+            self._json = fetcher.dumps(self)
+        return self._json
+
+
+# _details_cache is the only server-side owner of details, so it holds at most this many.
+# Each is a shallow copy sharing its data with the fetcher's parse cache (bounded to the
+# same number of pages), plus its serialized JSON; a long-running server therefore keeps
+# at most 2 * _DETAILS_CACHE_SIZE parsed pages alive in the worst case.
+_DETAILS_CACHE_SIZE = fetcher.PARSED_CACHE_SIZE
+_details_cache: Dict[str, _DetailDict] = _LRUCache(maxsize=_DETAILS_CACHE_SIZE)
 
 # Pretty printing flag (set later)
 PRETTY = False
 COLOR = False
 
 
+def _build_suffix_index(buf: bytes) -> array:
+    """Suffix array of ``buf`` by prefix doubling.
+
+    Each round sorts offsets by the rank of their first 2k bytes, using integer keys, so
+    memory stays linear in ``len(buf)`` (no suffix is ever copied out).
+    """
+    n = len(buf)
+    sa = list(range(n))
+    rank = list(buf)
+    k = 1
+    while n:
+        width = max(rank) + 2
+        keys = [rank[i] * width + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+        sa.sort(key=keys.__getitem__)
+        r = 0
+        prev = keys[sa[0]]
+        for i in sa:
+            if keys[i] != prev:
+                r += 1
+                prev = keys[i]
+            rank[i] = r
+        if r == n - 1 or k >= n:
+            break
+        k *= 2
+    return array('q', sa)
+
+
+def _suffix_search(query: bytes) -> List[Component]:
+    """Entries matching ``query`` (which must not contain the record separators)."""
+    buf = _search_buf
+    width = len(query)
+
+    def prefix(pos):
+        return buf[pos:pos + width]
+
+    lo = bisect.bisect_left(_suffix_index, query, key=prefix)
+    hi = bisect.bisect_right(_suffix_index, query, lo=lo, key=prefix)
+    hits = {bisect.bisect_right(_search_starts, pos) - 1 for pos in _suffix_index[lo:hi]}
+    return [_index_cache[i] for i in sorted(hits)]
+
+
+def _buffer_search(query: bytes) -> List[Component]:
+    """Entries matching ``query`` using repeated ``bytes.find`` over _search_buf.
+
+    The query must not contain the record separators, so every hit lies within a single
+    name or description.
+    """
+    hits = []
+    starts = _search_starts
+    pos = _search_buf.find(query)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        hits.append(_index_cache[i])
+        if i + 1 == len(starts):
+            break
+        # Resume at the next record: one hit per entry is enough.
+        pos = _search_buf.find(query, starts[i + 1])
+    return hits
+
+
+def _load_index(force: bool = False) -> List[Component]:
+    """Component index, reusing the on-disk snapshot unless the overview HTML is newer.
+
+    A snapshot that cannot be read or does not have the expected shape is ignored and
+    rebuilt from the overview page.
+    """
+    if not force:
+        try:
+            if _INDEX_CACHE_FILE.stat().st_mtime_ns >= fetcher.overview_cache_file().stat().st_mtime_ns:
+                index = fetcher.loads(_INDEX_CACHE_FILE.read_bytes())
+                if isinstance(index, list):
+                    return [Component.from_dict(c) for c in index]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+    index = fetcher.build_component_index(force=force)
+    # Write to a private temp file then rename, so concurrent servers never read a partial file.
+    tmp = _INDEX_CACHE_FILE.with_name(f'{_INDEX_CACHE_FILE.name}.{os.getpid()}.tmp')
+    try:
+        tmp.write_bytes(fetcher.dumps(index))
+        os.replace(tmp, _INDEX_CACHE_FILE)
+    except OSError:
+        pass
+    return [Component.from_dict(c) for c in index]
+
+
 def ensure_index(force: bool = False):
-    global _index_cache
+    global _index_cache, _suffix_index, _index_by_name_lc, _search_buf, _search_starts
     if _index_cache is None or force:
-        _index_cache = fetcher.build_component_index(force=force)
+        _index_cache = _load_index(force=force)
+        _search_buf = b'\x00'.join(c.name_b + b'\x01' + c.desc_b for c in _index_cache)
+        _search_starts = []
+        pos = 0
+        for c in _index_cache:
+            _search_starts.append(pos)
+            pos += len(c.name_b) + len(c.desc_b) + 2
+        _suffix_index = _build_suffix_index(_search_buf) if len(_index_cache) >= _SUFFIX_INDEX_MIN else None
+        _index_by_name_lc = {}
+        for c in _index_cache:
+            _index_by_name_lc.setdefault(c.name_lc, c)
+        _details_cache.clear()
     return _index_cache
 
 
 def handle_list_components(params: Dict[str, Any]):
     force = params.get('force', False)
     index = ensure_index(force=force)
-    return index
+    return [c.to_dict() for c in index]
+
+
+def _lookup_detail(name: str, force: bool):
+    """Detail for ``name`` (case-insensitive), or None when it is not in the index.
+
+    Details are served from _details_cache; ``force`` re-fetches the index and the page.
+    """
+    ensure_index(force=force)
+    target = _index_by_name_lc.get(name.lower())
+    if not target:
+        return None
+    url = target.url
+    if force or url not in _details_cache:
+        _details_cache[url] = _DetailDict(fetcher.get_component_detail(url, force=force))
+    return _details_cache[url]
 
 
 def handle_get_component(params: Dict[str, Any]):
     name = params.get('name')
     if not name:
         return {'error': 'Component name not provided in arguments'}
-    force = params.get('force', False)
-    index = ensure_index(force=force)
-    target = next((c for c in index if c['name'].lower() == name.lower()), None)
-    if not target:
+    detail = _lookup_detail(name, params.get('force', False))
+    if detail is None:
         return {'error': f'Component {name} not found'}
-    url = target['url']
-    if url not in _details_cache or force:
-        _details_cache[url] = fetcher.get_component_detail(url, force=force)
-    return _details_cache[url]
+    return detail
 
 
 def handle_search_components(params: Dict[str, Any]):
-    query = params['query'].lower()
-    index = ensure_index()
-    results = [c for c in index if query in c['name'].lower() or query in c.get('description', '').lower()]
+    query = params['query'].casefold().encode('utf-8')
+    ensure_index()
+    if query and b'\x00' not in query and b'\x01' not in query:
+        if _suffix_index is not None:
+            return [c.to_dict() for c in _suffix_search(query)]
+        return [c.to_dict() for c in _buffer_search(query)]
+    # bytes substring search avoids str kind dispatch; UTF-8 keeps matches equivalent.
+    results = [c.to_dict() for c in _index_cache if query in c.name_b or query in c.desc_b]
     return results
 
 
 def handle_export_all(params: Dict[str, Any]):
     force = params.get('force', False)
     filepath = params.get('filepath')
-    summary = fetcher.export_all_components(force=force, filepath=filepath)
+    max_workers = params.get('max_workers', fetcher.EXPORT_WORKERS)
+    if type(max_workers) is not int or max_workers < 1:
+        return {'error': 'max_workers must be a positive integer'}
+    summary = fetcher.export_all_components(force=force, filepath=filepath, max_workers=max_workers)
     return summary
 
 
@@ -280,16 +302,11 @@ def handle_get_component_props(params: Dict[str, Any]):
     name = params.get('name')
     if not name:
         return {'error': 'Component name not provided in arguments'}
-    force = params.get('force', False)
-    index = ensure_index(force=force)
-    target = next((c for c in index if c['name'].lower() == name.lower()), None)
-    if not target:
+    detail = _lookup_detail(name, params.get('force', False))
+    if detail is None:
         return {'error': f'Component {name} not found'}
-    url = target['url']
-    if url not in _details_cache or force:
-        _details_cache[url] = fetcher.get_component_detail(url, force=force)
-    detail = _details_cache[url]
-    return {'component': name, 'props_flat': detail.get('props_flat', []), 'count': len(detail.get('props_flat', []))}
+    props_flat = detail.get('props_flat', [])
+    return {'component': name, 'props_flat': props_flat, 'count': len(props_flat)}
 
 
 def rpc_result(id_: Any, result: Any):
@@ -302,97 +319,249 @@ def rpc_error(id_: Any, code: int, message: str):
     return obj
 
 
+_HANDLERS = {
+    'list_components': handle_list_components,
+    'get_component': handle_get_component,
+    'search_components': handle_search_components,
+    'export_all': handle_export_all,
+    'get_component_props': handle_get_component_props,
+}
+
+
 def process_tool_call(tool_name: str, arguments: Dict[str, Any]):
-    if tool_name == 'list_components':
-        return handle_list_components(arguments)
-    if tool_name == 'get_component':
-        return handle_get_component(arguments)
-    if tool_name == 'search_components':
-        return handle_search_components(arguments)
-    if tool_name == 'export_all':
-        return handle_export_all(arguments)
-    if tool_name == 'get_component_props':
-        return handle_get_component_props(arguments)
-    return {'error': f'Tool {tool_name} not implemented'}
+    handler = _HANDLERS.get(tool_name)
+    if handler is None:
+        return {'error': f'Tool {tool_name} not implemented'}
+    return handler(arguments)
+
+
+def handle_tools_list(id_: Any, req: Dict[str, Any]):
+    return rpc_result(id_, _TOOLS_LIST_RESULT)
+
+
+def handle_tools_call(id_: Any, req: Dict[str, Any]):
+    params = req.get('params', {})
+    tool_name = params.get('name')
+    arguments = params.get('arguments', {}) or {}
+    if not isinstance(tool_name, str) or tool_name not in TOOLS:
+        return rpc_error(id_, -32601, f'Unknown tool {tool_name}')
+    # Decoded names are fresh strings. Once validated, swap in the interned literal the
+    # TOOLS/_HANDLERS keys already use, so the dispatch probe hits on identity. Only known
+    # names are interned: interned strings can be immortal (CPython 3.12+), so interning
+    # arbitrary client input would leak.
+    tool_name = sys.intern(tool_name)
+    try:
+        result = process_tool_call(tool_name, arguments)
+        return rpc_result(id_, {'content': result})
+    except Exception as e:
+        return rpc_error(id_, -32603, f'Internal error: {e}')
+
+
+_METHODS = {
+    'tools/list': handle_tools_list,
+    'tools/call': handle_tools_call,
+}
 
 
 def process_request(req: Dict[str, Any]):
+    if not isinstance(req, dict):
+        return rpc_error(None, -32600, 'Invalid Request: expected a JSON object')
     method = req.get('method')
     id_ = req.get('id')
-    if method == 'tools/list':
-        tools_meta = []
-        for name, meta in TOOLS.items():
-            tools_meta.append({'name': name, 'description': meta['description'], 'input_schema': meta['input_schema']})
-        return rpc_result(id_, {'tools': tools_meta})
-    if method == 'tools/call':
-        params = req.get('params', {})
-        tool_name = params.get('name')
-        arguments = params.get('arguments', {}) or {}
-        if tool_name not in TOOLS:
-            return rpc_error(id_, -32601, f'Unknown tool {tool_name}')
-        try:
-            result = process_tool_call(tool_name, arguments)
-            return rpc_result(id_, {'content': result})
-        except Exception as e:
-            return rpc_error(id_, -32603, f'Internal error: {e}')
-    return rpc_error(id_, -32601, f'Unknown method {method}')
+    handler = _METHODS.get(method) if isinstance(method, str) else None
+    if handler is None:
+        return rpc_error(id_, -32601, f'Unknown method {method}')
+    return handler(id_, req)
+
+
+def _read_line_batches(stream, chunk_size: int = 65536):
+    """Yield the complete lines available after each bulk read from a binary stream.
+
+    ``read1`` returns whatever is already buffered (blocking only when nothing is),
+    so pipelined requests are decoded in batches instead of one readline at a time.
+    """
+    pending = b''
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
+
+
+# Responses accumulate here and are written out in one go once the buffer is large or
+# the client has nothing more queued, instead of a write + flush per response.
+_out_buf = bytearray()
+_FLUSH_THRESHOLD = 64 * 1024
+
+
+def _flush_output():
+    if _out_buf:
+        out = sys.stdout.buffer
+        out.write(_out_buf)
+        out.flush()
+        del _out_buf[:]
+
+
+def _queue_frame(data: bytes):
+    """Append one serialized frame to the output buffer.
+
+    Frames at least as large as the flush threshold would only be copied in and
+    written straight back out, so they go to stdout directly (after anything queued
+    ahead of them, to keep replies in order).
+    """
+    if len(data) >= _FLUSH_THRESHOLD:
+        _flush_output()
+        out = sys.stdout.buffer
+        out.write(data)
+        out.write(b'\n')
+        out.flush()
+        return
+    _out_buf.extend(data)
+    _out_buf.extend(b'\n')
+
+
+def _stdin_pending() -> bool:
+    """True if more input is ready to read without blocking; False when unknown."""
+    try:
+        return bool(select.select([sys.stdin], [], [], 0)[0])
+    except (OSError, ValueError):  # e.g. select() on a Windows pipe
+        return False
 
 
 def emit(obj: Dict[str, Any]):
-    """Write JSON to stdout with optional pretty formatting and colors."""
-    if PRETTY:
-        text = json.dumps(obj, ensure_ascii=False, indent=2)
-    else:
-        text = json.dumps(obj, ensure_ascii=False)
+    """Queue JSON for stdout with optional pretty formatting and colors."""
+    data = fetcher.dumps(obj, PRETTY)
     if COLOR:
         # Simple colorization: errors red, results green.
         if 'error' in obj:
-            text = '\x1b[31m' + text + '\x1b[0m'
+            data = b'\x1b[31m' + data + b'\x1b[0m'
+        else:
+            data = b'\x1b[32m' + data + b'\x1b[0m'
+    _queue_frame(data)
+
+
+# Envelope of a get_component reply around its id and content, in the compact separators
+# fetcher.dumps() uses with either encoder.
+_ENVELOPE_HEAD = b'{"jsonrpc":"2.0","id":'
+_ENVELOPE_MID = b',"result":{"content":'
+
+
+def _emit_fast(obj: Dict[str, Any]):
+    """emit() specialised for the default configuration (no pretty-printing, no colors)."""
+    result = obj.get('result')
+    if result.__class__ is dict:
+        content = result.get('content')
+        id_ = obj.get('id')
+        # Ids outside orjson's 64-bit range make dumps() fall back to the stdlib encoder for
+        # the whole frame (content included), so those replies take the generic path below.
+        if (content.__class__ is _DetailDict and len(result) == 1
+                and (id_.__class__ is not int or -2 ** 63 <= id_ < 2 ** 64)):
+            # Same bytes rpc_result() would serialize to, reusing the detail's cached JSON.
+            _queue_frame(_ENVELOPE_HEAD + fetcher.dumps(id_) + _ENVELOPE_MID + content.json_bytes() + b'}}')
+            return
+    _queue_frame(fetcher.dumps(obj))
+
+
+# Chosen by main() once the output flags are known.
+_emit_impl = emit
+
+
+_USAGE = 'usage: antd-mcp-server [-h] [--once ONCE] [--debug] [--pretty] [--color]\n'
+_HELP = _USAGE + """
+AntD MCP Server
+
+options:
+  -h, --help   show this help message and exit
+  --once ONCE  Provide a single JSON-RPC request string to process then exit
+  --debug      Enable debug logging to stderr
+  --pretty     Pretty-print JSON output
+  --color      Colorize output (ANSI)
+"""
+_FLAGS = ('--debug', '--pretty', '--color')
+
+
+def _usage_error(message: str):
+    sys.stderr.write(_USAGE + f'antd-mcp-server: error: {message}\n')
+    sys.exit(2)
+
+
+def _parse_args(argv: List[str]) -> Dict[str, Any]:
+    """Parse the handful of CLI options by hand; importing argparse costs more than the
+    work itself for one-shot ``--once`` invocations."""
+    args: Dict[str, Any] = {'once': None, 'debug': False, 'pretty': False, 'color': False}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        if arg == '--once':
+            # Like argparse, a following option is not taken as the request body.
+            if i + 1 >= len(argv) or (argv[i + 1].startswith('-') and argv[i + 1] != '-'):
+                _usage_error('argument --once: expected one argument')
+            args['once'] = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith('--once='):
+            args['once'] = arg[len('--once='):]
+        elif arg in _FLAGS:
+            args[arg[2:]] = True
         else:
-            text = '\x1b[32m' + text + '\x1b[0m'
-    sys.stdout.write(text + ('\n' if not PRETTY else '\n'))
-    sys.stdout.flush()
+            _usage_error(f'unrecognized arguments: {arg}')
+        i += 1
+    return args
 
 
 def main():
-    import argparse
-    import os
-    parser = argparse.ArgumentParser(description='AntD MCP Server')
-    parser.add_argument('--once', help='Provide a single JSON-RPC request string to process then exit')
-    parser.add_argument('--debug', action='store_true', help='Enable debug logging to stderr')
-    parser.add_argument('--pretty', action='store_true', help='Pretty-print JSON output')
-    parser.add_argument('--color', action='store_true', help='Colorize output (ANSI)')
-    args = parser.parse_args()
-    debug = args.debug or bool(os.environ.get('MCP_DEBUG'))
-    global PRETTY, COLOR
-    PRETTY = args.pretty or bool(os.environ.get('MCP_PRETTY'))
-    COLOR = args.color or bool(os.environ.get('MCP_COLOR'))
-
-    if args.once:
+    args = _parse_args(sys.argv[1:])
+    debug = args['debug'] or bool(os.environ.get('MCP_DEBUG'))
+    global PRETTY, COLOR, _emit_impl
+    PRETTY = args['pretty'] or bool(os.environ.get('MCP_PRETTY'))
+    COLOR = args['color'] or bool(os.environ.get('MCP_COLOR'))
+    _emit_impl = emit if PRETTY or COLOR else _emit_fast
+
+    once = args['once']
+    if once:
         try:
             if debug:
-                sys.stderr.write(f'[DEBUG] raw_once={args.once}\n')
-            req = json.loads(args.once)
+                sys.stderr.write(f'[DEBUG] raw_once={once}\n')
+            req = json.loads(once)
             out = process_request(req)
-            emit(out)
+            _emit_impl(out)
         except Exception as e:
-            emit(rpc_error(None, -32700, f'Parse error: {e}'))
+            _emit_impl(rpc_error(None, -32700, f'Parse error: {e}'))
+        _flush_output()
         return
 
-    for line in sys.stdin:
-        if debug:
-            sys.stderr.write(f'[DEBUG] raw_line={repr(line)}\n')
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            req = json.loads(line)
-        except Exception as e:
-            emit(rpc_error(None, -32700, f'Parse error: {e}'))
-            continue
-        resp = process_request(req)
-        emit(resp)
+    try:
+        for batch in _read_line_batches(sys.stdin.buffer):
+            for line in batch:
+                if debug:
+                    sys.stderr.write(f'[DEBUG] raw_line={repr(line)}\n')
+                if not line.strip():
+                    continue
+                try:
+                    # The stdlib parser, as for --once: orjson turns integer ids beyond 64 bits
+                    # into floats and rejects NaN/Infinity, so replies could not be matched.
+                    req = json.loads(line)
+                except Exception as e:
+                    _emit_impl(rpc_error(None, -32700, f'Parse error: {e}'))
+                    continue
+                resp = process_request(req)
+                _emit_impl(resp)
+                if len(_out_buf) >= _FLUSH_THRESHOLD:
+                    _flush_output()
+            # Hold replies back while the client is still pipelining requests.
+            if not _stdin_pending():
+                _flush_output()
+    finally:
+        # Replies already computed must not be lost if the loop dies.
+        _flush_output()
 
 if __name__ == '__main__':
-    import os
     main()
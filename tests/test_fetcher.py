@@ -0,0 +1,307 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+PAGE_CACHE_DIR = SRC_DIR.parent / 'cache'
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+sys.path.insert(0, str(SRC_DIR))
+import fetcher  # noqa: E402
+
+URL = 'https://example.com/components/button/'
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def tmp_cache(monkeypatch, tmp_path):
+    """Redirect the page cache to tmp_path and take the rate limiter out of the way."""
+    monkeypatch.setattr(fetcher, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(fetcher, '_CACHE_INDEX_FILE', tmp_path / 'index.json')
+    monkeypatch.setattr(fetcher._LIMITER, 'acquire', lambda: None)
+    fetcher._load_component.cache_clear()
+    yield tmp_path
+    fetcher._load_component.cache_clear()
+
+
+def stub_get(monkeypatch, *responses):
+    """Make _SESSION.get return ``responses`` in order, recording the headers it was sent."""
+    sent = []
+    pending = list(responses)
+
+    def get(url, timeout=None, headers=None):
+        sent.append(headers or {})
+        return pending.pop(0)
+
+    monkeypatch.setattr(fetcher._SESSION, 'get', get)
+    return sent
+
+
+def test_fetch_url_revalidates_with_conditional_get(tmp_cache, monkeypatch):
+    sent = stub_get(monkeypatch,
+                    FakeResponse(200, b'<html>v1</html>', {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+                    FakeResponse(304))
+    assert fetcher.fetch_url(URL) == b'<html>v1</html>'
+    html_file = fetcher._cache_path(URL, '.html')
+    meta_file = fetcher._cache_path(URL, '.meta.json')
+    assert json.loads(meta_file.read_text(encoding='utf-8')) == {
+        'etag': '"abc"', 'last_modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    assert json.loads((tmp_cache / 'index.json').read_text(encoding='utf-8')) == {fetcher._cache_key(URL): URL}
+    os.utime(html_file, ns=(1_000_000_000, 1_000_000_000))
+
+    # A 304 keeps the cached bytes and their mtime, so parsed sidecars stay valid.
+    assert fetcher.fetch_url(URL, force=True) == b'<html>v1</html>'
+    assert sent[1] == {'If-None-Match': '"abc"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    assert html_file.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_fetch_url_drops_validators_the_server_stops_sending(tmp_cache, monkeypatch):
+    stub_get(monkeypatch, FakeResponse(200, b'v1', {'ETag': '"abc"'}), FakeResponse(200, b'v2'))
+    fetcher.fetch_url(URL)
+    meta_file = fetcher._cache_path(URL, '.meta.json')
+    assert meta_file.exists()
+    assert fetcher.fetch_url(URL, force=True) == b'v2'
+    assert fetcher._cache_path(URL, '.html').read_bytes() == b'v2'
+    assert not meta_file.exists()
+
+
+def test_fetch_url_uses_cache_without_force(tmp_cache, monkeypatch):
+    sent = stub_get(monkeypatch, FakeResponse(200, b'v1'))
+    fetcher.fetch_url(URL)
+    assert fetcher.fetch_url(URL) == b'v1'
+    assert len(sent) == 1
+
+
+def test_fetch_url_raises_on_error_status(tmp_cache, monkeypatch):
+    stub_get(monkeypatch, FakeResponse(404))
+    with pytest.raises(fetcher.FetchError):
+        fetcher.fetch_url(URL)
+    assert not fetcher._cache_path(URL, '.html').exists()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def test_rate_limiter_accrues_debt_and_sleeps_it_off(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fetcher, 'time', clock)
+    limiter = fetcher._RateLimiter(rate=2.0, burst=2)
+
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == []  # the burst is free
+    limiter.acquire()
+    limiter.acquire()
+    # Each call past the burst reserves the next token, so waits stack up: 1/rate, 2/rate.
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(1.0)]
+
+    clock.now = 1.5  # refills 3 tokens, paying off the 2-token debt
+    limiter.acquire()
+    assert len(clock.sleeps) == 2
+
+    clock.now = 100.0  # refill is capped at the burst size
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps[2:] == [pytest.approx(0.5)]
+
+
+_EXPORT_INDEX = [
+    {'name': 'Affix', 'url': 'https://example.com/components/affix/'},
+    {'name': 'Broken', 'url': 'https://example.com/components/broken/'},
+    {'name': 'NoUrl', 'url': None},
+    {'name': 'Button', 'url': 'https://example.com/components/button/'},
+    {'name': 'Card', 'url': 'https://example.com/components/card/'},
+]
+
+
+@pytest.fixture
+def stub_export(monkeypatch):
+    delays = {'affix': 0.05, 'button': 0.02, 'card': 0.0}
+
+    def get_component_detail(url, force=False):
+        slug = url.rstrip('/').rsplit('/', 1)[1]
+        if slug == 'broken':
+            raise fetcher.FetchError('Failed status=500')
+        # Earlier components finish last, so out-of-order completion would show up.
+        time.sleep(delays[slug])
+        return {'title': slug, 'source_url': url}
+
+    monkeypatch.setattr(fetcher, 'build_component_index', lambda force=False: _EXPORT_INDEX)
+    monkeypatch.setattr(fetcher, 'get_component_detail', get_component_detail)
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+@pytest.mark.parametrize('validate', [True, False])
+def test_export_all_streams_valid_json_in_overview_order(stub_export, monkeypatch, tmp_path, validate, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(fetcher, 'orjson', None)
+    path = tmp_path / 'export.json'
+    summary = fetcher.export_all_components(filepath=str(path), validate=validate, max_workers=4)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert list(data) == ['generated_at', 'components', 'count']
+    names = [c['name'] for c in data['components']]
+    if validate:
+        assert names == ['Affix', 'Button', 'Card']
+        assert summary['errors'] == 0
+    else:
+        assert names == ['Affix', 'Broken', 'NoUrl', 'Button', 'Card']
+        assert summary['errors'] == 2
+        assert data['components'][2]['error'] == 'Missing URL'
+    assert summary['filepath'] == str(path)
+    assert summary['count'] == data['count'] == len(names)
+    assert data['components'][0] == {'title': 'affix', 'source_url': _EXPORT_INDEX[0]['url'], 'name': 'Affix'}
+
+
+def test_export_all_writes_an_empty_export(monkeypatch, tmp_path):
+    monkeypatch.setattr(fetcher, 'build_component_index', lambda force=False: [])
+    path = tmp_path / 'export.json'
+    summary = fetcher.export_all_components(filepath=str(path))
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data['components'] == [] and data['count'] == 0
+    assert summary['count'] == 0 and summary['errors'] == 0
+
+
+def test_parse_overview_keeps_every_card_under_a_shared_anchor():
+    html = '''<html><body>
+    <a href="/components/q1/">
+      <div class="components-overview-card"><div class="components-overview-title">Q1 甲</div></div>
+      <div class="components-overview-card"><div class="components-overview-title">Q22 乙</div></div>
+    </a>
+    <div class="components-overview-card">
+      <div class="components-overview-title">Solo 独立</div><a href="/components/solo/">go</a>
+    </div>
+    </body></html>'''
+    comps = fetcher.parse_overview(html)
+    assert [(c['name'], c['display_name'], c['url']) for c in comps] == [
+        ('Q1', 'Q1 甲', fetcher.BASE_URL + '/components/q1/'),
+        ('Q22', 'Q22 乙', fetcher.BASE_URL + '/components/q1/'),
+        ('Solo', 'Solo 独立', fetcher.BASE_URL + '/components/solo/'),
+    ]
+
+
+# Expected outputs in tests/data were produced by the original BeautifulSoup parser.
+def _cached_page(url):
+    return (PAGE_CACHE_DIR / (fetcher._cache_key(url) + '.html')).read_bytes()
+
+
+def _expected(name):
+    return json.loads((DATA_DIR / name).read_text(encoding='utf-8'))
+
+
+@pytest.mark.parametrize('as_bytes', [True, False])
+def test_parse_overview_matches_checked_in_page(as_bytes):
+    html = _cached_page(fetcher.BASE_URL + fetcher.OVERVIEW_PATH)
+    assert fetcher.parse_overview(html if as_bytes else html.decode('utf-8')) == _expected('overview_parsed.json')
+
+
+@pytest.mark.parametrize('as_bytes', [True, False])
+def test_parse_component_matches_checked_in_page(as_bytes):
+    html = _cached_page(fetcher.BASE_URL + '/components/button-cn/')
+    assert fetcher.parse_component(html if as_bytes else html.decode('utf-8')) == _expected('button_parsed.json')
+
+
+def test_parse_component_fixture():
+    # Comments, <br>, script/style/template contents, duplicate headers and pre > div > code.
+    html = (DATA_DIR / 'component_fixture.html').read_bytes()
+    data = fetcher.parse_component(html)
+    assert data == _expected('component_fixture_parsed.json')
+    assert data['title'] == 'DemoTitle'
+    assert data['props'][0]['rows'][1]['类型'] == 'boolean\n|\nnull'
+    assert data['examples'] == ['const a = 1;\nb', 'plain']
+
+
+def test_text_skips_script_style_and_template():
+    doc = fetcher._parse_html('<table><tr><td><script>var x=1</script>v<style>.c{}</style>'
+                              '<template>t</template><!-- c -->w</td></tr></table>')
+    td = next(doc.iter('td'))
+    assert fetcher._text(td) == 'vw'
+    assert fetcher._text(td, '\n') == 'v\nw'
+
+
+def _page(title):
+    return ('<html><body><h1>%s</h1></body></html>' % title).encode('utf-8')
+
+
+def _write_sidecar(data, version, mtime_ns):
+    sidecar = fetcher._cache_path(URL, '.json')
+    sidecar.write_text(json.dumps({'version': version, 'data': data}), encoding='utf-8')
+    os.utime(sidecar, ns=(mtime_ns, mtime_ns))
+
+
+def test_component_detail_uses_sidecar_only_when_current(tmp_cache, monkeypatch):
+    stub_get(monkeypatch, FakeResponse(200, _page('Fresh')))
+    assert fetcher.get_component_detail(URL)['title'] == 'Fresh'
+    html_ns = fetcher._cache_path(URL, '.html').stat().st_mtime_ns
+    stored = {'title': 'FromSidecar', 'props_flat': []}
+
+    # A current sidecar is used as is, without re-parsing the HTML.
+    _write_sidecar(stored, fetcher._PARSED_CACHE_VERSION, html_ns + 1)
+    fetcher._load_component.cache_clear()
+    assert fetcher.get_component_detail(URL)['title'] == 'FromSidecar'
+
+    # One older than the HTML is ignored...
+    _write_sidecar(stored, fetcher._PARSED_CACHE_VERSION, html_ns - 1)
+    fetcher._load_component.cache_clear()
+    assert fetcher.get_component_detail(URL)['title'] == 'Fresh'
+
+    # ...and so is one written by another parser version.
+    _write_sidecar(stored, fetcher._PARSED_CACHE_VERSION - 1, html_ns + 1)
+    fetcher._load_component.cache_clear()
+    assert fetcher.get_component_detail(URL)['title'] == 'Fresh'
+    # The re-parse rewrote the sidecar in the current version.
+    sidecar = json.loads(fetcher._cache_path(URL, '.json').read_text(encoding='utf-8'))
+    assert sidecar['version'] == fetcher._PARSED_CACHE_VERSION
+    assert sidecar['data']['title'] == 'Fresh'
+
+
+def test_forced_download_returns_fresh_detail(tmp_cache, monkeypatch):
+    stub_get(monkeypatch, FakeResponse(200, _page('Old')), FakeResponse(200, _page('New')))
+    assert fetcher.get_component_detail(URL)['title'] == 'Old'
+    html_file = fetcher._cache_path(URL, '.html')
+    os.utime(html_file, ns=(1_000_000_000, 1_000_000_000))
+    fetcher._load_component.cache_clear()
+    assert fetcher.get_component_detail(URL)['title'] == 'Old'  # cached under the old mtime
+
+    assert fetcher.get_component_detail(URL, force=True)['title'] == 'New'
+    assert html_file.stat().st_mtime_ns != 1_000_000_000
+    assert fetcher.get_component_detail(URL)['title'] == 'New'
+
+
+def test_component_detail_returns_a_copy(tmp_cache, monkeypatch):
+    stub_get(monkeypatch, FakeResponse(200, _page('Button')))
+    first = fetcher.get_component_detail(URL)
+    assert first['source_url'] == URL
+    first['name'] = 'Button'
+    first['title'] = 'changed'
+    second = fetcher.get_component_detail(URL)
+    assert second is not first
+    assert second['title'] == 'Button' and 'name' not in second
+
+
+@pytest.mark.parametrize('pretty', [False, True])
+def test_dumps_output_does_not_depend_on_orjson(monkeypatch, pretty):
+    if fetcher.orjson is None:
+        pytest.skip('orjson is not installed')
+    obj = {'id': 1, 'result': {'content': [{'name': '按钮', 'n': 2.5, 'ok': True, 'none': None}]}, 'big': 2 ** 70}
+    small = {k: v for k, v in obj.items() if k != 'big'}
+    with_orjson = [fetcher.dumps(obj, pretty), fetcher.dumps(small, pretty)]
+    monkeypatch.setattr(fetcher, 'orjson', None)
+    assert [fetcher.dumps(obj, pretty), fetcher.dumps(small, pretty)] == with_orjson
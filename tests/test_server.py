@@ -1,3 +1,4 @@
+import gc
 import json
 import subprocess
 import sys
@@ -8,6 +9,10 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_DIR = PROJECT_ROOT / 'src'
 PYTHON = sys.executable  # current interpreter
 
+sys.path.insert(0, str(SRC_DIR))
+import pytest  # noqa: E402
+import server  # noqa: E402
+
 
 def run_once(request_obj):
     request_str = json.dumps(request_obj, ensure_ascii=False)
@@ -72,3 +77,197 @@ def test_non_existent_component():
     payload = resp['result']['content']
     assert 'error' in payload
 
+
+
+def run_stream(request_lines):
+    env = {**os.environ, 'PYTHONPATH': str(SRC_DIR)}
+    proc = subprocess.run([PYTHON, str(SRC_DIR / 'server.py')], input=''.join(l + '\n' for l in request_lines),
+                          capture_output=True, text=True, timeout=60, env=env)
+    assert proc.returncode == 0, proc.stderr
+    return [json.loads(line) for line in proc.stdout.splitlines()]
+
+
+def test_stream_replies_in_order_and_rejects_non_objects():
+    resps = run_stream([
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}),
+        '[1]',
+        'not json',
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "tools/list"}),
+    ])
+    assert [r['id'] for r in resps] == [1, None, None, 2]
+    assert resps[1]['error']['code'] == -32600
+    assert resps[2]['error']['code'] == -32700
+
+
+@pytest.fixture
+def fresh_index(monkeypatch, tmp_path):
+    """Point the index snapshot and overview HTML at tmp_path and force ensure_index() to rebuild."""
+    overview = tmp_path / 'overview.html'
+    overview.write_bytes(b'<html></html>')
+    os.utime(overview, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.setattr(server.fetcher, 'overview_cache_file', lambda: overview)
+    monkeypatch.setattr(server, '_INDEX_CACHE_FILE', tmp_path / 'component_index.json')
+    monkeypatch.setattr(server, '_index_cache', None)
+    yield tmp_path / 'component_index.json'
+    server._details_cache.clear()
+
+
+@pytest.mark.parametrize('snapshot', ['[{"name": "Button"}]', '[{"name": "Button", "url": null}]', '{"a": 1}', '[1]'])
+def test_malformed_index_snapshot_is_rebuilt(fresh_index, monkeypatch, snapshot):
+    fresh_index.write_text(snapshot, encoding='utf-8')
+    entry = {'name': 'Table', 'display_name': 'Table表格', 'url': 'https://example.com/components/table/', 'description': ''}
+    monkeypatch.setattr(server.fetcher, 'build_component_index', lambda force=False: [entry])
+    index = server.ensure_index()
+    assert [c.to_dict() for c in index] == [entry]
+    # The rebuilt index replaces the bad snapshot.
+    assert json.loads(fresh_index.read_text(encoding='utf-8')) == [entry]
+
+
+def test_index_snapshot_is_reused_until_the_overview_html_changes(fresh_index, monkeypatch):
+    old = {'name': 'Old', 'url': 'https://example.com/components/old/', 'description': ''}
+    new = {'name': 'New', 'url': 'https://example.com/components/new/', 'description': ''}
+    built = []
+
+    def build(force=False):
+        built.append(force)
+        return [old] if len(built) == 1 else [new]
+
+    monkeypatch.setattr(server.fetcher, 'build_component_index', build)
+    assert [c.name for c in server.ensure_index()] == ['Old']
+    # A new process reuses the snapshot without touching the overview page.
+    server._index_cache = None
+    assert [c.name for c in server.ensure_index()] == ['Old']
+    assert built == [False]
+    # Refreshing the overview HTML (e.g. export_all with force) makes the snapshot stale.
+    html = server.fetcher.overview_cache_file()
+    snapshot_ns = fresh_index.stat().st_mtime_ns
+    os.utime(html, ns=(snapshot_ns + 1, snapshot_ns + 1))
+    server._index_cache = None
+    assert [c.name for c in server.ensure_index()] == ['New']
+    assert built == [False, False]
+
+
+def _linear_search(query):
+    return [c for c in server._index_cache if query in c.name_b or query in c.desc_b]
+
+
+_SEARCH_ENTRIES = [
+    {'name': 'Button', 'url': 'https://example.com/b', 'description': 'To trigger an operation.'},
+    {'name': 'Table', 'url': 'https://example.com/t', 'description': 'A table displays rows of data.'},
+    {'name': 'Tabs', 'url': 'https://example.com/s', 'description': '选项卡切换组件。'},
+    {'name': 'Tag', 'url': 'https://example.com/g', 'description': 'Tag for categorizing or markup.'},
+]
+_SEARCH_QUERIES = ['ta', 'tab', 'tag', 'button', 'on.', 'a', 'rows of', '切换', 'markup.', 'zzz', 'tabs']
+
+
+def test_suffix_search_matches_linear_scan(fresh_index, monkeypatch):
+    monkeypatch.setattr(server, '_SUFFIX_INDEX_MIN', 1)
+    monkeypatch.setattr(server.fetcher, 'build_component_index', lambda force=False: _SEARCH_ENTRIES)
+    server.ensure_index()
+    assert server._suffix_index is not None
+    for q in _SEARCH_QUERIES:
+        query = q.casefold().encode('utf-8')
+        assert server._suffix_search(query) == _linear_search(query), q
+
+
+def test_details_cache_bounds_live_details(fresh_index, monkeypatch):
+    size = server._DETAILS_CACHE_SIZE
+    entries = [{'name': f'C{i}', 'url': f'https://example.com/components/c{i}/', 'description': ''}
+               for i in range(2 * size)]
+    monkeypatch.setattr(server.fetcher, 'build_component_index', lambda force=False: entries)
+    monkeypatch.setattr(server.fetcher, 'get_component_detail', lambda url, force=False: {'source_url': url})
+    server.ensure_index()
+    for i in range(size):
+        server._lookup_detail(f'C{i}', False)
+    first = server._lookup_detail('C0', False)
+    for i in range(size, 2 * size - 1):
+        server._lookup_detail(f'C{i}', False)
+    assert len(server._details_cache) == size
+    assert sum(isinstance(o, server._DetailDict) for o in gc.get_objects()) == size
+    # C0 was used most recently before the last fills, so it survives; C1 was evicted.
+    assert server._lookup_detail('C0', False) is first
+    assert 'https://example.com/components/c1/' not in server._details_cache
+
+
+def test_buffer_search_matches_linear_scan(fresh_index, monkeypatch):
+    monkeypatch.setattr(server.fetcher, 'build_component_index', lambda force=False: _SEARCH_ENTRIES)
+    server.ensure_index()
+    assert server._suffix_index is None
+    for q in _SEARCH_QUERIES:
+        query = q.casefold().encode('utf-8')
+        assert server._buffer_search(query) == _linear_search(query), q
+    # Hits in the last record, its name and its description, and in a description only.
+    assert [c.name for c in server._buffer_search(b'markup.')] == ['Tag']
+    assert [c.name for c in server._buffer_search(b'tag')] == ['Tag']
+    assert [c.name for c in server._buffer_search(b'rows')] == ['Table']
+    # Queries are matched within one name or description, never across the separators.
+    assert server._buffer_search(b'on.') == _linear_search(b'on.')
+    assert server.handle_search_components({'query': 'N.\x00TA'}) == []
+    assert server.handle_search_components({'query': 'Button\x01To'}) == []
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+@pytest.mark.parametrize('id_', [7, 'x"y', None, 1.5, 2 ** 70, -1])
+def test_emit_fast_splice_is_byte_identical(monkeypatch, use_orjson, id_):
+    if not use_orjson:
+        monkeypatch.setattr(server.fetcher, 'orjson', None)
+    detail = server._DetailDict(title='按钮 "Button"', props=[{'属性': 'block', 'n': [1, 2.5, None, True]}])
+    obj = server.rpc_result(id_, {'content': detail})
+    server._out_buf.clear()
+    server._emit_fast(obj)
+    assert bytes(server._out_buf) == server.fetcher.dumps(obj) + b'\n'
+    # A second emit reuses the cached JSON and still matches.
+    server._out_buf.clear()
+    server._emit_fast(obj)
+    assert bytes(server._out_buf) == server.fetcher.dumps(obj) + b'\n'
+    server._out_buf.clear()
+
+
+def test_parse_args_flags_and_once():
+    assert server._parse_args([]) == {'once': None, 'debug': False, 'pretty': False, 'color': False}
+    args = server._parse_args(['--pretty', '--once', '{"id": 1}', '--color'])
+    assert args == {'once': '{"id": 1}', 'debug': False, 'pretty': True, 'color': True}
+    assert server._parse_args(['--once={"a": "b=c"}'])['once'] == '{"a": "b=c"}'
+    assert server._parse_args(['--once='])['once'] == ''
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['--once'], 'argument --once: expected one argument'),
+    (['--once', '--pretty'], 'argument --once: expected one argument'),
+    (['--bogus'], 'unrecognized arguments: --bogus'),
+    (['--pre'], 'unrecognized arguments: --pre'),
+])
+def test_parse_args_usage_errors(capsys, argv, message):
+    with pytest.raises(SystemExit) as exc:
+        server._parse_args(argv)
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith('usage: antd-mcp-server')
+    assert err.endswith(f'antd-mcp-server: error: {message}\n')
+
+
+@pytest.mark.parametrize('flag', ['-h', '--help'])
+def test_parse_args_help(capsys, flag):
+    with pytest.raises(SystemExit) as exc:
+        server._parse_args(['--debug', flag])
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert out.startswith('usage: antd-mcp-server') and '--once ONCE' in out
+
+
+def test_stream_and_once_keep_ids_beyond_64_bits():
+    big = 2 ** 70
+    request = '{"jsonrpc":"2.0","id":%d,"method":"tools/list"}' % big
+    [resp] = run_stream([request])
+    assert resp['id'] == big and isinstance(resp['id'], int)
+    assert run_once(json.loads(request))['id'] == big
+    [resp] = run_stream(['{"jsonrpc":"2.0","id":Infinity,"method":"tools/list"}'])
+    assert 'result' in resp
+
+
+def test_tools_call_interns_only_known_tool_names():
+    bogus = ''.join(['no_such_', 'tool_xyz'])  # built at runtime, so not interned
+    resp = server.handle_tools_call(2, {'params': {'name': bogus}})
+    assert resp['error']['code'] == -32601
+    # Had the handler interned it, interning an equal string would return that object.
+    assert sys.intern(''.join(['no_such_', 'tool_xyz'])) is not bogus